@@ -1,61 +1,55 @@
-from google.genai import types
-from google.adk.tools import ToolContext
 from google.adk.agents import Agent
-from google.adk.tools.agent_tool import AgentTool
-from google.adk.models.lite_llm import LiteLlm
 from .sub_agents.data_analyst import data_analyst
 from .sub_agents.financial_analyst import financial_analyst
 from .sub_agents.news_analyst import news_analyst
+from .models import GPT4O, NANO, RoutedLlm
 from .prompt import PROMPT
+from .semantic_cache import cache_analysis, use_cached_analysis
+from .telemetry import log_model_latency, start_model_timer
+from .tools import (
+    data_analyst_tool,
+    financial_analyst_tool,
+    gather_all_analyses,
+    get_report_guidelines,
+    news_analyst_tool,
+    save_advice_report,
+)
 
-MODEL = LiteLlm("openai/gpt-5-nano")
-
-async def save_advice_report(tool_context: ToolContext, summary: str, ticker: str):
-    state = tool_context.state
-    data_analyst_result = state.get("data_analyst_result")
-    financial_analyst_result = state.get("financial_analyst_result")
-    news_analyst_result = state.get("news_analyst_result")
-    report = f"""
-    # Excetutive Summary and Advice:
-    {summary}
-
-    ## Data Analyst Report:
-    {data_analyst_result}
-
-    ## Financial Analyst Report:
-    {financial_analyst_result}
-
-    ## News Analyst Report:
-    {news_analyst_result}
-
-    """
-    state["report"] = report
-
-    filename = f"{ticker}_investment_advice.md"
-
-    artifact = types.Part(
-        inline_data=types.Blob(
-            mime_type="text/markdown",
-            data=report.encode("utf-8"),
-        )
-    )
 
-    await tool_context.save_artifact(filename, artifact)
+# Gather facts and chat on the fast model; write the recommendation and report
+# (the turns right after analyst results or report guidelines) on gpt-4o.
+ADVISOR_MODEL = RoutedLlm(
+    model=NANO.model,
+    fast=NANO,
+    strong=GPT4O,
+    strong_after_tools=frozenset(
+        {
+            gather_all_analyses.__name__,
+            data_analyst.name,
+            financial_analyst.name,
+            news_analyst.name,
+            get_report_guidelines.__name__,
+        }
+    ),
+)
 
-    return {
-        "success": True,
-    }
 
 financial_advisor = Agent(
     name="FinancialAdvisor",
     instruction=PROMPT,
-    model=MODEL,
+    model=ADVISOR_MODEL,
     tools=[
-        AgentTool(agent=financial_analyst),
-        AgentTool(agent=news_analyst),
-        AgentTool(agent=data_analyst),
+        gather_all_analyses,
+        financial_analyst_tool,
+        news_analyst_tool,
+        data_analyst_tool,
+        get_report_guidelines,
         save_advice_report,
     ],
+    before_tool_callback=use_cached_analysis,
+    after_tool_callback=cache_analysis,
+    before_model_callback=start_model_timer,
+    after_model_callback=log_model_latency,
 )
 
 # "root_agent" is mandatory
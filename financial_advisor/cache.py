@@ -0,0 +1,124 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+CACHE_DIR = Path(os.getenv("FINANCIAL_ADVISOR_CACHE_DIR", ".cache"))
+
+# Time-to-live (seconds) per kind of Yahoo Finance data.
+INFO_TTL = 60 * 60
+HISTORY_TTL = 60 * 60
+STATEMENT_TTL = 24 * 60 * 60
+NEWS_TTL = 15 * 60
+# yfinance reports many request failures as empty data, so empty results are only
+# trusted for a few minutes; a genuinely missing dataset still costs one request
+# per EMPTY_TTL instead of one per call.
+EMPTY_TTL = 5 * 60
+
+
+class FileCache:
+    """
+    File-backed cache for JSON-serializable Yahoo Finance responses.
+
+    Entries live under ``{root}/{ticker}/{endpoint}_{md5(params)}.json`` together
+    with the time they were fetched, so repeated tool calls for the same ticker
+    within the TTL are served from disk instead of hitting Yahoo again. Entries
+    read or written by this process are also kept in memory, so several tools
+    asking for the same data in one turn skip both the disk read and JSON parse.
+    """
+
+    def __init__(self, root: Path = CACHE_DIR):
+        self.root = Path(root)
+        self._memory: dict[Path, dict] = {}
+        self._locks: dict[Path, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock(self, ticker: str, endpoint: str, params: dict) -> threading.Lock:
+        path = self._path(ticker, endpoint, params)
+        with self._locks_guard:
+            return self._locks.setdefault(path, threading.Lock())
+
+    def _path(self, ticker: str, endpoint: str, params: dict) -> Path:
+        # The ticker comes from the LLM: never let it resolve to "." or "..".
+        safe_ticker = re.sub(r"[^A-Z0-9.^=-]", "_", ticker.upper()).strip(".") or "_"
+        digest = hashlib.md5(
+            json.dumps(params, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        return self.root / safe_ticker / f"{endpoint}_{digest}.json"
+
+    def get(self, ticker: str, endpoint: str, ttl: float, params: dict | None = None):
+        """
+        Returns the cached value, or None when missing, expired, or unreadable.
+
+        Empty values expire after at most EMPTY_TTL, whatever the requested ttl.
+        """
+        path = self._path(ticker, endpoint, params or {})
+        entry = self._memory.get(path)
+        if entry is None:
+            try:
+                with path.open("r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                return None
+            self._memory[path] = entry
+        if _is_empty(entry.get("data")):
+            ttl = min(ttl, EMPTY_TTL)
+        if time.time() - entry.get("timestamp", 0) > ttl:
+            self._memory.pop(path, None)
+            return None
+        return entry.get("data")
+
+    def set(self, ticker: str, endpoint: str, data: Any, params: dict | None = None):
+        """Stores a value; failures are ignored so caching never breaks a tool."""
+        path = self._path(ticker, endpoint, params or {})
+        self._memory[path] = {"timestamp": time.time(), "data": data}
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump(self._memory[path], f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            tmp_path.unlink(missing_ok=True)
+
+    def get_or_fetch(
+        self,
+        ticker: str,
+        endpoint: str,
+        fetch_fn: Callable[[], Any],
+        ttl: float,
+        params: dict | None = None,
+    ):
+        """
+        Returns the cached value if still fresh, otherwise calls fetch_fn and caches it.
+
+        Concurrent misses on the same key are single-flighted: one caller fetches
+        while the others wait and then read its result. Empty results are cached for
+        EMPTY_TTL only (see get).
+        """
+        data = self.get(ticker, endpoint, ttl, params)
+        if data is not None:
+            return data
+        with self._lock(ticker, endpoint, params or {}):
+            data = self.get(ticker, endpoint, ttl, params)
+            if data is None:
+                data = fetch_fn()
+                self.set(ticker, endpoint, data, params)
+        return data
+
+
+def _is_empty(data: Any) -> bool:
+    if data is None or getattr(data, "empty", False) is True:
+        return True
+    if isinstance(data, str):
+        return data.strip() in ("", "{}", "[]")
+    if isinstance(data, (list, dict)):
+        return not data
+    return False
+
+
+cache = FileCache()
@@ -0,0 +1,45 @@
+from typing import AsyncGenerator
+
+import httpx
+import litellm
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.adk.models.lite_llm import LiteLlm
+
+# One pooled HTTP client for every LiteLLM call made by the advisor and its
+# sub-agents, so connections and TLS sessions are reused across agents.
+if litellm.aclient_session is None:
+    litellm.aclient_session = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    )
+
+NANO = LiteLlm(model="openai/gpt-5-nano")
+GPT4O = LiteLlm(model="openai/gpt-4o")
+
+
+class RoutedLlm(BaseLlm):
+    """
+    Routes each call to a fast or a strong model.
+
+    Calls that follow one of strong_after_tools' results (e.g. the analyst
+    results the final recommendation is written from) go to the strong model;
+    fact-gathering and conversational turns go to the fast one.
+    """
+
+    fast: BaseLlm
+    strong: BaseLlm
+    strong_after_tools: frozenset[str] = frozenset()
+
+    def _route(self, llm_request: LlmRequest) -> BaseLlm:
+        if llm_request.contents:
+            for part in llm_request.contents[-1].parts or []:
+                response = part.function_response
+                if response and response.name in self.strong_after_tools:
+                    return self.strong
+        return self.fast
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        llm = self._route(llm_request)
+        async for llm_response in llm.generate_content_async(llm_request, stream=stream):
+            yield llm_response
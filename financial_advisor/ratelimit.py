@@ -0,0 +1,67 @@
+import threading
+import time
+from functools import wraps
+from typing import Callable, TypeVar
+
+from yfinance.exceptions import YFRateLimitError
+
+MAX_CONCURRENT_REQUESTS = 8
+REQUESTS_PER_SECOND = 5
+MAX_ATTEMPTS = 4
+MIN_BACKOFF = 1
+MAX_BACKOFF = 30
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` acquisitions per second, bursting to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Yahoo requests run on asyncio.to_thread workers, so the limits are thread-level.
+SEM = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+BUCKET = TokenBucket(REQUESTS_PER_SECOND, REQUESTS_PER_SECOND)
+
+
+def rate_limited(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    Runs a blocking Yahoo Finance call under the shared concurrency and rate limits.
+
+    On a Yahoo rate-limit error the call is retried with exponential backoff
+    (1s, 2s, 4s, capped at 30s) for up to MAX_ATTEMPTS attempts.
+    """
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs) -> T:
+        for attempt in range(MAX_ATTEMPTS):
+            with SEM:
+                BUCKET.acquire()
+                try:
+                    return fn(*args, **kwargs)
+                except YFRateLimitError:
+                    if attempt == MAX_ATTEMPTS - 1:
+                        raise
+            time.sleep(min(MAX_BACKOFF, MIN_BACKOFF * 2**attempt))
+
+    return wrapper
@@ -0,0 +1,158 @@
+import base64
+import re
+import time
+from typing import Any
+
+import litellm
+import numpy as np
+from google.adk.tools import BaseTool, ToolContext
+from google.adk.tools.agent_tool import AgentTool
+from .cache import INFO_TTL, NEWS_TTL, STATEMENT_TTL
+
+EMBEDDING_MODEL = "openai/text-embedding-3-small"
+# text-embedding-3 models can shorten their output; 256 dimensions keep each
+# stored entry around 1.4KB instead of ~30KB of JSON floats.
+EMBEDDING_DIMENSIONS = 256
+SIMILARITY_THRESHOLD = 0.92
+MAX_ENTRIES_PER_ANALYST = 32
+# A cached analysis must not outlive the market data it was built from.
+ANALYSIS_TTLS = {
+    "data_analyst_result": INFO_TTL,
+    "financial_analyst_result": STATEMENT_TTL,
+    "news_analyst_result": NEWS_TTL,
+}
+DEFAULT_ANALYSIS_TTL = NEWS_TTL
+# Each analyst gets its own state key, so storing one result only rewrites that
+# analyst's entries in the state delta.
+STATE_KEY_PREFIX = "semantic_cache:"
+# Embedding computed on a cache miss, waiting for the analyst result to be stored.
+# temp: state only lives for the current invocation, so nothing leaks if the
+# analyst fails and the after_tool_callback never runs.
+PENDING_KEY_PREFIX = "temp:semantic_cache_pending:"
+
+
+def _tickers(text: str) -> list[str]:
+    """Ticker-like tokens in a request, so 'Analyze AAPL' never matches 'Analyze MSFT'."""
+    return sorted(set(re.findall(r"\b[A-Z]{1,5}(?:[.-][A-Z])?\b", text)))
+
+
+def _encode(embedding: np.ndarray) -> str:
+    return base64.b64encode(embedding.astype(np.float32).tobytes()).decode("ascii")
+
+
+def _decode(encoded: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(encoded), dtype=np.float32)
+
+
+async def _embed(text: str) -> str | None:
+    # The cache is best-effort: if embedding fails, the analyst simply runs.
+    try:
+        response = await litellm.aembedding(
+            model=EMBEDDING_MODEL, input=[text], dimensions=EMBEDDING_DIMENSIONS
+        )
+    except Exception:
+        return None
+    return _encode(np.asarray(response.data[0]["embedding"]))
+
+
+async def lookup(
+    tool_context: ToolContext, output_key: str, query: str
+) -> tuple[Any, str | None]:
+    """
+    Looks for a previous analyst result whose request is semantically close to query.
+
+    Returns (result, embedding). On a hit the cached result is also written back to
+    state[output_key], exactly as if the analyst had just run. The embedding (base64
+    float32) is returned so a miss can be stored without embedding the query twice.
+    """
+    embedding = await _embed(query)
+    if embedding is None:
+        return None, None
+
+    ttl = ANALYSIS_TTLS.get(output_key, DEFAULT_ANALYSIS_TTL)
+    now = time.time()
+    entries = [
+        entry
+        for entry in tool_context.state.get(STATE_KEY_PREFIX + output_key, [])
+        if now - entry.get("timestamp", 0) <= ttl
+    ]
+    if entries:
+        matrix = np.stack([_decode(entry["embedding"]) for entry in entries])
+        vector = _decode(embedding)
+        scores = matrix @ vector / (
+            np.linalg.norm(matrix, axis=1) * np.linalg.norm(vector)
+        )
+        tickers = _tickers(query)
+        for index in np.argsort(scores)[::-1]:
+            if scores[index] < SIMILARITY_THRESHOLD:
+                break
+            if entries[index]["tickers"] == tickers:
+                result = entries[index]["result"]
+                tool_context.state[output_key] = result
+                return result, embedding
+
+    return None, embedding
+
+
+def store(
+    tool_context: ToolContext,
+    output_key: str,
+    query: str,
+    embedding: str,
+    result: Any,
+):
+    """Records an analyst result under its request embedding in session state."""
+    # Reassign rather than mutate so ADK records the change in the state delta.
+    state_key = STATE_KEY_PREFIX + output_key
+    ttl = ANALYSIS_TTLS.get(output_key, DEFAULT_ANALYSIS_TTL)
+    now = time.time()
+    # Drop expired entries while rewriting, so the state never carries them.
+    entries = [
+        entry
+        for entry in tool_context.state.get(state_key, [])
+        if now - entry.get("timestamp", 0) <= ttl
+    ]
+    entries.append(
+        {
+            "embedding": embedding,
+            "tickers": _tickers(query),
+            "result": result,
+            "timestamp": now,
+        }
+    )
+    tool_context.state[state_key] = entries[-MAX_ENTRIES_PER_ANALYST:]
+
+
+def _output_key(tool: BaseTool) -> str | None:
+    if isinstance(tool, AgentTool):
+        return getattr(tool.agent, "output_key", None)
+    return None
+
+
+async def use_cached_analysis(
+    tool: BaseTool, args: dict[str, Any], tool_context: ToolContext
+):
+    """before_tool_callback: answers an analyst call from the cache on a near-duplicate request."""
+    output_key = _output_key(tool)
+    if output_key is None:
+        return None
+
+    result, embedding = await lookup(tool_context, output_key, args.get("request", ""))
+    if result is not None:
+        return {"result": result}
+    if embedding is not None:
+        tool_context.state[PENDING_KEY_PREFIX + tool_context.function_call_id] = embedding
+    return None
+
+
+async def cache_analysis(
+    tool: BaseTool, args: dict[str, Any], tool_context: ToolContext, tool_response
+):
+    """after_tool_callback: stores a freshly computed analyst result."""
+    pending_key = PENDING_KEY_PREFIX + tool_context.function_call_id
+    embedding = tool_context.state.get(pending_key)
+    output_key = _output_key(tool)
+    if embedding is not None and output_key is not None and tool_response:
+        tool_context.state[pending_key] = None
+        store(tool_context, output_key, args.get("request", ""), embedding, tool_response)
+    return None
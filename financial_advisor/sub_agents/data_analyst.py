@@ -1,12 +1,35 @@
+import asyncio
+
 import yfinance as yf
 from google.adk.agents import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
+from ..cache import HISTORY_TTL, INFO_TTL, cache
+from ..models import NANO
+from ..ratelimit import rate_limited
+from ..telemetry import log_model_latency, start_model_timer
+
+
+@rate_limited
+def _fetch_info(ticker: str) -> dict:
+    return yf.Ticker(ticker).info
+
 
+def _get_info(ticker: str) -> dict:
+    """Returns Yahoo's info dict for a ticker, shared by all DataAnalyst tools."""
+    return cache.get_or_fetch(ticker, "info", lambda: _fetch_info(ticker), INFO_TTL)
 
-MODEL = LiteLlm(model="openai/gpt-5-nano")
+
+def _get_company_info(ticker: str) -> dict:
+    info = _get_info(ticker)
+    return {
+        "ticker": ticker,
+        "success": True,
+        "company_name": info.get("longName", "NA"),
+        "industry": info.get("industry", "NA"),
+        "sector": info.get("sector", "NA"),
+    }
 
 
-def get_company_info(ticker: str) -> str:
+async def get_company_info(ticker: str) -> str:
     """
     Retrieves basic company information for a given stock ticker.
 
@@ -25,7 +48,7 @@ def get_company_info(ticker: str) -> str:
             - sector (str): Broader sector categorization
 
     Example:
-        >>> get_company_info('MSFT')
+        >>> await get_company_info('MSFT')
         {
             'ticker': 'MSFT',
             'success': True,
@@ -34,23 +57,58 @@ def get_company_info(ticker: str) -> str:
             'sector': 'Technology'
         }
     """
-    stock = yf.Ticker(ticker)
-    info = stock.info
+    return await asyncio.to_thread(_get_company_info, ticker)
+
+
+def _price_frequency(period: str) -> str | None:
+    """Resampling frequency for a history period: daily up to 1mo, weekly up to 1y, else monthly."""
+    if period in ("1d", "5d", "1mo"):
+        return None
+    if period in ("3mo", "6mo", "1y", "ytd"):
+        return "W"
+    return "ME"
+
+
+@rate_limited
+def _fetch_history(ticker: str, period: str, fields: list[str], freq: str | None) -> str:
+    history = yf.Ticker(ticker).history(period=period)
+    if history.empty:
+        return "{}"
+    history = history[[field for field in fields if field in history.columns] or ["Close"]]
+    if freq:
+        history = history.resample(freq).last()
+    history = history.dropna(how="all").round(2)
+    history.index = history.index.strftime("%Y-%m-%d")
+    return history.to_json(orient="split")
+
+
+def _get_stock_price(ticker: str, period: str, fields: list[str] | None = None) -> dict:
+    fields = fields or ["Close"]
+    freq = _price_frequency(period)
+    info = _get_info(ticker)
+    history = cache.get_or_fetch(
+        ticker,
+        "history",
+        lambda: _fetch_history(ticker, period, fields, freq),
+        HISTORY_TTL,
+        {"period": period, "fields": fields, "freq": freq},
+    )
     return {
         "ticker": ticker,
         "success": True,
-        "company_name": info.get("longName", "NA"),
-        "industry": info.get("industry", "NA"),
-        "sector": info.get("sector", "NA"),
+        "history": history,
+        "current_price": info.get("currentPrice"),
     }
 
 
-def get_stock_price(ticker: str, period: str) -> str:
+async def get_stock_price(ticker: str, period: str, fields: list[str] | None = None) -> str:
     """
     Fetches historical stock price data and current trading price for a given ticker.
 
-    This tool retrieves both the current market price and historical price data
-    over a specified time period, including open, high, low, close prices and volume.
+    This tool retrieves both the current market price and a compact price history
+    over a specified time period. To keep the result small, only the requested
+    columns are returned and longer periods are downsampled: daily rows up to
+    1 month, weekly up to 1 year, and monthly beyond that.
 
     Args:
         ticker (str): Stock ticker symbol (e.g., 'AAPL' for Apple Inc.)
@@ -66,35 +124,42 @@ def get_stock_price(ticker: str, period: str) -> str:
             - '10y': 10 years
             - 'ytd': Year to date
             - 'max': Maximum available data
+        fields (list[str], optional): Price columns to include, any of 'Open', 'High',
+            'Low', 'Close', 'Volume'. Defaults to ['Close'].
 
     Returns:
         dict: A dictionary containing:
             - ticker (str): The input ticker symbol
             - success (bool): True if the operation was successful
-            - history (str): JSON-formatted historical price data with OHLCV
+            - history (str): JSON-formatted price history ("split" orientation:
+              columns, index of dates, data rows), rounded to 2 decimals
             - current_price (float): Current market price of the stock
 
     Example:
-        >>> get_stock_price('TSLA', '3mo')
+        >>> await get_stock_price('TSLA', '3mo')
         {
             'ticker': 'TSLA',
             'success': True,
-            'history': '{"Open": {...}, "High": {...}, ...}',
+            'history': '{"columns":["Close"],"index":["2024-07-07",...],"data":[[251.52],...]}',
             'current_price': 245.67
         }
     """
-    stock = yf.Ticker(ticker)
-    info = stock.info
-    history = stock.history(period=period)
+    return await asyncio.to_thread(_get_stock_price, ticker, period, fields)
+
+
+def _get_financial_metrics(ticker: str) -> dict:
+    info = _get_info(ticker)
     return {
         "ticker": ticker,
         "success": True,
-        "history": history.to_json(),
-        "current_price": info.get("currentPrice"),
+        "market_cap": info.get("marketCap", "NA"),
+        "pe_ratio": info.get("trailingPE", "NA"),
+        "dividend_yield": info.get("dividendYield", "NA"),
+        "beta": info.get("beta", "NA"),
     }
 
 
-def get_financial_metrics(ticker: str) -> str:
+async def get_financial_metrics(ticker: str) -> str:
     """
     Retrieves key financial metrics and valuation ratios for stock analysis.
 
@@ -120,7 +185,7 @@ def get_financial_metrics(ticker: str) -> str:
         - Beta: <1 means less volatile than market; >1 means more volatile
 
     Example:
-        >>> get_financial_metrics('JNJ')
+        >>> await get_financial_metrics('JNJ')
         {
             'ticker': 'JNJ',
             'success': True,
@@ -130,36 +195,87 @@ def get_financial_metrics(ticker: str) -> str:
             'beta': 0.65
         }
     """
-    stock = yf.Ticker(ticker)
-    info = stock.info
-    return {
-        "ticker": ticker,
-        "success": True,
-        "market_cap": info.get("marketCap", "NA"),
-        "pe_ratio": info.get("trailingPE", "NA"),
-        "dividend_yield": info.get("dividendYield", "NA"),
-        "beta": info.get("beta", "NA"),
-    }
+    return await asyncio.to_thread(_get_financial_metrics, ticker)
+
+
+async def get_company_info_batch(tickers: list[str]) -> dict:
+    """
+    Retrieves basic company information for several stock tickers at once.
+
+    The lookups run concurrently, so covering N companies costs about one
+    round-trip instead of N. Use this instead of get_company_info when more than
+    one ticker is involved.
+
+    Args:
+        tickers (list[str]): Stock ticker symbols (e.g., ['AAPL', 'MSFT', 'GOOG'])
+
+    Returns:
+        dict: A mapping of each ticker to the same dictionary get_company_info returns.
+
+    Example:
+        >>> await get_company_info_batch(['AAPL', 'MSFT'])
+        {
+            'AAPL': {'ticker': 'AAPL', 'success': True, 'company_name': 'Apple Inc.', ...},
+            'MSFT': {'ticker': 'MSFT', 'success': True, 'company_name': 'Microsoft Corporation', ...}
+        }
+    """
+    tickers = list(dict.fromkeys(tickers))
+    results = await asyncio.gather(*(get_company_info(ticker) for ticker in tickers))
+    return dict(zip(tickers, results))
+
+
+async def get_financial_metrics_batch(tickers: list[str]) -> dict:
+    """
+    Retrieves key financial metrics and valuation ratios for several stock tickers at once.
+
+    The lookups run concurrently, so comparing N companies costs about one
+    round-trip instead of N. Use this instead of get_financial_metrics when more
+    than one ticker is involved.
+
+    Args:
+        tickers (list[str]): Stock ticker symbols (e.g., ['KO', 'PEP'])
+
+    Returns:
+        dict: A mapping of each ticker to the same dictionary get_financial_metrics returns.
+
+    Example:
+        >>> await get_financial_metrics_batch(['KO', 'PEP'])
+        {
+            'KO': {'ticker': 'KO', 'success': True, 'market_cap': 265000000000, ...},
+            'PEP': {'ticker': 'PEP', 'success': True, 'market_cap': 210000000000, ...}
+        }
+    """
+    tickers = list(dict.fromkeys(tickers))
+    results = await asyncio.gather(*(get_financial_metrics(ticker) for ticker in tickers))
+    return dict(zip(tickers, results))
 
 
 data_analyst = LlmAgent(
     name="DataAnalyst",
-    model=MODEL,
+    model=NANO,
     description="Gathers and analyzes basic stock market data using multiple focused tools",
     instruction="""
-    You are a Data Analyst who gathers stock information using 4 specialized tools:
+    You are a Data Analyst who gathers stock information using 5 specialized tools:
     
     1. **get_company_info(ticker)** - Learn about the company (name, sector, industry)
     2. **get_stock_price(ticker, period)** - Get current pricing and trading ranges
     3. **get_financial_metrics(ticker)** - Check key financial ratios  
+    4. **get_company_info_batch(tickers)** - Company info for several tickers at once
+    5. **get_financial_metrics_batch(tickers)** - Financial ratios for several tickers at once
     
+    When more than one ticker is referenced, prefer the batch tools over calling
+    the single-ticker tools repeatedly.
     Use multiple focused tools to gather different types of data.
     Explain what each tool provides and present the information clearly.
     """,
     output_key="data_analyst_result",
+    before_model_callback=start_model_timer,
+    after_model_callback=log_model_latency,
     tools=[
         get_company_info,
         get_stock_price,
         get_financial_metrics,
+        get_company_info_batch,
+        get_financial_metrics_batch,
     ],
 )
\ No newline at end of file
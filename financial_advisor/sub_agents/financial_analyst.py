@@ -1,8 +1,241 @@
+import asyncio
+
+import numpy as np
+import orjson
+import pandas as pd
 import yfinance as yf
 from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
+from ..cache import STATEMENT_TTL, cache
+from ..models import NANO
+from ..ratelimit import rate_limited
+from ..telemetry import log_model_latency, start_model_timer
+
+
+def _statement_to_json(statement: pd.DataFrame) -> str:
+    """Serializes a statement as {period: {line item: value}} with orjson."""
+    return orjson.dumps(
+        {str(period): values.to_dict() for period, values in statement.items()},
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+    ).decode()
+
+
+@rate_limited
+def _download_statement(ticker: str, statement: str) -> pd.DataFrame:
+    return getattr(yf.Ticker(ticker), statement)
+
+
+def _fetch_statement(ticker: str, statement: str) -> str:
+    """Fetches one financial statement (blocking HTTP call) as JSON."""
+    return cache.get_or_fetch(
+        ticker,
+        statement,
+        lambda: _statement_to_json(_download_statement(ticker, statement)),
+        STATEMENT_TTL,
+    )
+
+
+def _load_statement(ticker: str, statement: str) -> pd.DataFrame:
+    """Reads one statement from the shared cache back into a DataFrame."""
+    frame = pd.DataFrame(orjson.loads(_fetch_statement(ticker, statement)))
+    if not frame.empty:
+        frame.columns = pd.to_datetime(frame.columns)
+    return frame
+
+
+async def get_financial_statements(ticker: str):
+    """
+    Retrieves the income statement, balance sheet, and cash flow statement in one call.
+
+    The three statements are fetched concurrently from Yahoo Finance, so the call
+    takes roughly as long as the slowest single statement instead of all three
+    back to back.
+
+    Args:
+        ticker (str): Stock ticker symbol (e.g., 'AAPL' for Apple Inc.)
+
+    Returns:
+        dict: A dictionary containing:
+            - ticker (str): The input ticker symbol
+            - success (bool): True if the operation was successful
+            - income_statement (str): JSON-formatted income statement data
+              (revenue, gross profit, operating income, EBITDA, net income, EPS)
+            - balance_sheet (str): JSON-formatted balance sheet data
+              (assets, liabilities, shareholders' equity, working capital)
+            - cash_flow (str): JSON-formatted cash flow statement
+              (operating cash flow, CapEx, free cash flow, investing and financing)
+            Each statement is a JSON object keyed by period end date, mapping
+            line item names to values: {period: {line item: value}}.
+
+    Example:
+        >>> await get_financial_statements('NVDA')
+        {
+            'ticker': 'NVDA',
+            'success': True,
+            'income_statement': '{"2025-01-31 00:00:00": {"Total Revenue": 130497000000.0, ...}, ...}',
+            'balance_sheet': '{"2025-01-31 00:00:00": {"Total Assets": 111601000000.0, ...}, ...}',
+            'cash_flow': '{"2025-01-31 00:00:00": {"Operating Cash Flow": 64089000000.0, ...}, ...}'
+        }
+    """
+    income_statement, balance_sheet, cash_flow = await asyncio.gather(
+        asyncio.to_thread(_fetch_statement, ticker, "income_stmt"),
+        asyncio.to_thread(_fetch_statement, ticker, "balance_sheet"),
+        asyncio.to_thread(_fetch_statement, ticker, "cash_flow"),
+    )
+    return {
+        "ticker": ticker,
+        "success": True,
+        "income_statement": income_statement,
+        "balance_sheet": balance_sheet,
+        "cash_flow": cash_flow,
+    }
+
+
+def _row(statement: pd.DataFrame, *names: str) -> pd.Series | None:
+    """Returns the first line item present in a statement, newest period first."""
+    for name in names:
+        if name in statement.index:
+            return statement.loc[name].astype(float)
+    return None
+
 
-MODEL = LiteLlm(model="openai/gpt-5-nano")
+def _ratio(numerator: pd.Series | None, denominator: pd.Series | None) -> pd.Series | None:
+    if numerator is None or denominator is None:
+        return None
+    return numerator / denominator.replace(0, np.nan)
+
+
+def _latest(series: pd.Series | None) -> float | None:
+    if series is None:
+        return None
+    series = series.dropna()
+    return None if series.empty else round(float(series.iloc[0]), 4)
+
+
+def _growth(series: pd.Series | None) -> float | None:
+    """Change of the latest period over the one before it."""
+    if series is None or len(series) < 2:
+        return None
+    latest, previous = series.iloc[0], series.iloc[1]
+    if pd.isna(latest) or pd.isna(previous) or previous == 0:
+        return None
+    return round(float((latest - previous) / abs(previous)), 4)
+
+
+def _quarterly_changes(series: pd.Series | None) -> dict[str, float]:
+    """Quarter-over-quarter changes for the trailing four quarters."""
+    if series is None:
+        return {}
+    series = series.iloc[:5]
+    previous = series.shift(-1)
+    changes = ((series - previous) / previous.abs().replace(0, np.nan)).iloc[:4].dropna().round(4)
+    return {str(period.date()): float(change) for period, change in changes.items()}
+
+
+def _summarize_statements(
+    ticker: str,
+    income: pd.DataFrame,
+    balance: pd.DataFrame,
+    cash_flow: pd.DataFrame,
+    quarterly_income: pd.DataFrame,
+) -> dict:
+    revenue = _row(income, "Total Revenue", "Operating Revenue")
+    net_income = _row(income, "Net Income", "Net Income Common Stockholders")
+    operating_cash_flow = _row(cash_flow, "Operating Cash Flow")
+    capital_expenditure = _row(cash_flow, "Capital Expenditure")
+    if operating_cash_flow is not None and capital_expenditure is not None:
+        free_cash_flow = operating_cash_flow - capital_expenditure.abs()
+    else:
+        free_cash_flow = _row(cash_flow, "Free Cash Flow")
+
+    return {
+        "ticker": ticker,
+        "success": True,
+        "period": str(income.columns[0].date()) if not income.empty else None,
+        "margins": {
+            "gross_margin": _latest(_ratio(_row(income, "Gross Profit"), revenue)),
+            "operating_margin": _latest(_ratio(_row(income, "Operating Income"), revenue)),
+            "net_margin": _latest(_ratio(net_income, revenue)),
+        },
+        "liquidity": {
+            "current_ratio": _latest(
+                _ratio(
+                    _row(balance, "Current Assets"),
+                    _row(balance, "Current Liabilities"),
+                )
+            ),
+            "debt_to_equity": _latest(
+                _ratio(
+                    _row(balance, "Total Debt"),
+                    _row(balance, "Stockholders Equity", "Common Stock Equity"),
+                )
+            ),
+        },
+        "cash_flow": {
+            "operating_cash_flow": _latest(operating_cash_flow),
+            "free_cash_flow": _latest(free_cash_flow),
+        },
+        "trends": {
+            "revenue_growth_yoy": _growth(revenue),
+            "net_income_growth_yoy": _growth(net_income),
+            "free_cash_flow_growth_yoy": _growth(free_cash_flow),
+            "revenue_qoq": _quarterly_changes(
+                _row(quarterly_income, "Total Revenue", "Operating Revenue")
+            ),
+            "net_income_qoq": _quarterly_changes(
+                _row(quarterly_income, "Net Income", "Net Income Common Stockholders")
+            ),
+        },
+    }
+
+
+async def get_financial_summary(ticker: str):
+    """
+    Retrieves key ratios and trends computed from the company's financial statements.
+
+    This tool computes margins, liquidity, leverage, free cash flow, and growth
+    trends from the annual and quarterly statements, so the analysis can start
+    from a handful of numbers instead of the full statements.
+
+    Args:
+        ticker (str): Stock ticker symbol (e.g., 'AAPL' for Apple Inc.)
+
+    Returns:
+        dict: A dictionary containing:
+            - ticker (str): The input ticker symbol
+            - success (bool): True if the operation was successful
+            - period (str): End date of the latest fiscal year
+            - margins (dict): gross_margin, operating_margin, net_margin (0.25 = 25%)
+            - liquidity (dict): current_ratio, debt_to_equity
+            - cash_flow (dict): operating_cash_flow, free_cash_flow (Operating CF - CapEx)
+            - trends (dict): revenue_growth_yoy, net_income_growth_yoy,
+              free_cash_flow_growth_yoy, and revenue_qoq / net_income_qoq mapping
+              each of the trailing four quarters to its quarter-over-quarter change
+
+    Notes:
+        - Ratios are for the latest fiscal year; missing line items yield None
+        - All amounts are in the company's reporting currency
+
+    Example:
+        >>> await get_financial_summary('AAPL')
+        {
+            'ticker': 'AAPL',
+            'success': True,
+            'period': '2024-09-30',
+            'margins': {'gross_margin': 0.4621, 'operating_margin': 0.3151, 'net_margin': 0.2397},
+            'liquidity': {'current_ratio': 0.8673, 'debt_to_equity': 1.8723},
+            'cash_flow': {'operating_cash_flow': 118254000000.0, 'free_cash_flow': 108807000000.0},
+            'trends': {'revenue_growth_yoy': 0.0202, ...}
+        }
+    """
+    # Read the same cached statements get_financial_statements serves, so calling
+    # both tools costs one download per statement.
+    income, balance, cash_flow, quarterly_income = await asyncio.gather(
+        asyncio.to_thread(_load_statement, ticker, "income_stmt"),
+        asyncio.to_thread(_load_statement, ticker, "balance_sheet"),
+        asyncio.to_thread(_load_statement, ticker, "cash_flow"),
+        asyncio.to_thread(_load_statement, ticker, "quarterly_income_stmt"),
+    )
+    return _summarize_statements(ticker, income, balance, cash_flow, quarterly_income)
 
 
 def get_income_statement(ticker: str):
@@ -20,7 +253,8 @@ def get_income_statement(ticker: str):
         dict: A dictionary containing:
             - ticker (str): The input ticker symbol
             - success (bool): True if the operation was successful
-            - income_statement (str): JSON-formatted income statement data including:
+            - income_statement (str): JSON-formatted income statement data keyed by period end date,
+              with line items including:
                 * Total Revenue
                 * Cost of Revenue
                 * Gross Profit
@@ -40,15 +274,13 @@ def get_income_statement(ticker: str):
         {
             'ticker': 'GOOGL',
             'success': True,
-            'income_statement': '{"Total Revenue": {...}, "Net Income": {...}}'
+            'income_statement': '{"2024-12-31 00:00:00": {"Total Revenue": 350018000000.0, "Net Income": 100118000000.0, ...}, ...}'
         }
     """
-    stock = yf.Ticker(ticker)
-    # return stock.income_stmt.to_json()
     return {
         "ticker": ticker,
         "success": True,
-        "income_statement": stock.income_stmt.to_json(),
+        "income_statement": _fetch_statement(ticker, "income_stmt"),
     }
 
 
@@ -67,7 +299,8 @@ def get_balance_sheet(ticker: str):
         dict: A dictionary containing:
             - ticker (str): The input ticker symbol
             - success (bool): True if the operation was successful
-            - balance_sheet (str): JSON-formatted balance sheet data including:
+            - balance_sheet (str): JSON-formatted balance sheet data keyed by period end date,
+              with line items including:
                 * Current Assets (cash, receivables, inventory)
                 * Non-Current Assets (PP&E, intangibles, investments)
                 * Current Liabilities (payables, short-term debt)
@@ -86,15 +319,13 @@ def get_balance_sheet(ticker: str):
         {
             'ticker': 'AMZN',
             'success': True,
-            'balance_sheet': '{"Total Assets": {...}, "Total Liabilities": {...}}'
+            'balance_sheet': '{"2024-12-31 00:00:00": {"Total Assets": 624894000000.0, "Total Liabilities Net Minority Interest": 338924000000.0, ...}, ...}'
         }
     """
-    stock = yf.Ticker(ticker)
-    # return stock.balance_sheet.to_json()
     return {
         "ticker": ticker,
         "success": True,
-        "balance_sheet": stock.balance_sheet.to_json(),
+        "balance_sheet": _fetch_statement(ticker, "balance_sheet"),
     }
 
 
@@ -113,7 +344,8 @@ def get_cash_flow(ticker: str):
         dict: A dictionary containing:
             - ticker (str): The input ticker symbol
             - success (bool): True if the operation was successful
-            - cash_flow (str): JSON-formatted cash flow statement including:
+            - cash_flow (str): JSON-formatted cash flow statement keyed by period end date,
+              with line items including:
                 * Operating Cash Flow (cash from core business)
                 * Capital Expenditures (CapEx)
                 * Free Cash Flow (Operating CF - CapEx)
@@ -133,41 +365,42 @@ def get_cash_flow(ticker: str):
         {
             'ticker': 'META',
             'success': True,
-            'cash_flow': '{"Operating Cash Flow": {...}, "Free Cash Flow": {...}}'
+            'cash_flow': '{"2024-12-31 00:00:00": {"Operating Cash Flow": 91328000000.0, "Free Cash Flow": 52102000000.0, ...}, ...}'
         }
     """
-    stock = yf.Ticker(ticker)
-    # return stock.balance_sheet.to_json()
     return {
         "ticker": ticker,
         "success": True,
-        "cash_flow": stock.cash_flow.to_json(),
+        "cash_flow": _fetch_statement(ticker, "cash_flow"),
     }
 
 
 financial_analyst = Agent(
     name="FinancialAnalyst",
-    model=MODEL,
+    model=NANO,
     description="Analyzes detailed financial statements including income, balance sheet, and cash flow",
     instruction="""
     You are a Financial Analyst who performs deep financial statement analysis. Your job:
     
-    1. **Income Analysis**: Use get_income_statement() to analyze revenue, profitability, and margins
-    2. **Balance Sheet Analysis**: Use get_balance_sheet() to examine assets, liabilities, and financial position
-    3. **Cash Flow Analysis**: Use get_cash_flow() to assess cash generation and capital allocation
+    1. **Income Analysis**: Analyze revenue, profitability, and margins
+    2. **Balance Sheet Analysis**: Examine assets, liabilities, and financial position
+    3. **Cash Flow Analysis**: Assess cash generation and capital allocation
     
     **Your Financial Tools:**
-    - **get_income_statement(ticker)**: Revenue, profit margins, and profitability analysis
-    - **get_balance_sheet(ticker)**: Assets, debt, equity, and financial strength ratios
-    - **get_cash_flow(ticker)**: Operating cash flow, free cash flow, and capital expenditure
+    - **get_financial_summary(ticker)**: Margins, current ratio, debt/equity, free cash flow, and growth trends, pre-computed
+    - **get_financial_statements(ticker)**: Income statement, balance sheet, and cash flow in a single call
+    
+    Start with get_financial_summary(). Call get_financial_statements() only when you need line items
+    the summary does not cover; it returns all three statements together.
     
     Analyze the financial health and performance of companies using comprehensive financial statement data.
     Focus on key financial ratios, trends, and indicators that reveal the company's financial strength.
     """,
     output_key="financial_analyst_result",
+    before_model_callback=start_model_timer,
+    after_model_callback=log_model_latency,
     tools=[
-        get_income_statement,
-        get_balance_sheet,
-        get_cash_flow,
+        get_financial_summary,
+        get_financial_statements,
     ],
 )
\ No newline at end of file
@@ -1,12 +1,44 @@
+import asyncio
+
 import yfinance as yf
 from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
+from ..cache import NEWS_TTL, cache
+from ..models import NANO
+from ..ratelimit import rate_limited
+from ..telemetry import log_model_latency, start_model_timer
+
+
+MAX_NEWS_ITEMS = 10
+
+
+def _trim_news_item(item: dict) -> dict:
+    # Newer yfinance nests the article under "content"; older versions return it flat.
+    content = item.get("content", item)
+    provider = content.get("provider") or {}
+    return {
+        "title": content.get("title"),
+        "publisher": provider.get("displayName") or content.get("publisher"),
+        "published": content.get("pubDate") or content.get("providerPublishTime"),
+        "summary": (content.get("summary") or "")[:500],
+    }
 
 
-MODEL = LiteLlm(model="openai/gpt-5-nano")
+@rate_limited
+def _fetch_news(ticker: str) -> list[dict]:
+    news_items = yf.Ticker(ticker).get_news() or []
+    return [_trim_news_item(item) for item in news_items[:MAX_NEWS_ITEMS]]
 
 
-def get_company_news(ticker: str):
+def _get_company_news(ticker: str) -> dict:
+    news_items = cache.get_or_fetch(ticker, "news", lambda: _fetch_news(ticker), NEWS_TTL)
+    return {
+        "ticker": ticker,
+        "success": True,
+        "news": news_items,
+    }
+
+
+async def get_company_news(ticker: str):
     """
     Retrieves recent news articles for the given ticker using yfinance.
 
@@ -17,20 +49,18 @@ def get_company_news(ticker: str):
         dict: A dictionary containing:
             - ticker (str): The input ticker symbol
             - success (bool): True if the operation was successful
-            - news (list[dict]): A list of news items as returned by yfinance.Ticker.get_news()
+            - news (list[dict]): Up to 10 recent news items, each with:
+                * title (str): Headline
+                * publisher (str): Publishing outlet
+                * published (str): Publication date
+                * summary (str): Article summary, truncated to 500 characters
     """
-    stock = yf.Ticker(ticker)
-    news_items = stock.get_news() or []
-    return {
-        "ticker": ticker,
-        "success": True,
-        "news": news_items,
-    }
+    return await asyncio.to_thread(_get_company_news, ticker)
 
 
 news_analyst = Agent(
     name="NewsAnalyst",
-    model=MODEL,
+    model=NANO,
     description="Fetches recent company news via yfinance for up-to-date market information.",
     instruction="""
     You are a News Analyst Specialist who uses web tools to find current information. Your job:
@@ -39,11 +69,14 @@ news_analyst = Agent(
     2. **Summarize Findings**: Explain what you found and its relevance
     
     **Your Web Tools:**
-    - **get_company_news(ticker)**: Retrieve recent news via yfinance.Ticker.get_news()
+    - **get_company_news(ticker)**: Retrieve up to 10 recent news items via yfinance, each with
+      title, publisher, published date, and a short summary
     
     Use external APIs to search and scrape web content for current information.
     """,
     output_key="news_analyst_result",
+    before_model_callback=start_model_timer,
+    after_model_callback=log_model_latency,
     tools=[
         get_company_news,
     ],
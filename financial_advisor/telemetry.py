@@ -0,0 +1,55 @@
+import logging
+import time
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+
+logger = logging.getLogger(__name__)
+
+# Open model-call span per agent. temp: state is dropped when the invocation ends,
+# so a span left open by a failed or interrupted model call cannot leak.
+SPAN_KEY_PREFIX = "temp:model_span:"
+
+
+def start_model_timer(callback_context: CallbackContext, llm_request: LlmRequest):
+    """before_model_callback: opens a latency span for the upcoming LLM call."""
+    key = SPAN_KEY_PREFIX + callback_context.agent_name
+    callback_context.state[key] = {"start": time.perf_counter(), "first_token": None}
+    return None
+
+
+def log_model_latency(callback_context: CallbackContext, llm_response: LlmResponse):
+    """
+    after_model_callback: logs time-to-first-token and tokens per second.
+
+    When streaming is enabled this runs once per chunk; the first chunk marks the
+    first token and the final (non-partial) chunk closes the span.
+    """
+    key = SPAN_KEY_PREFIX + callback_context.agent_name
+    span = callback_context.state.get(key)
+    if span is None:
+        return None
+
+    now = time.perf_counter()
+    if span["first_token"] is None:
+        span = {**span, "first_token": now}
+        callback_context.state[key] = span
+    if llm_response.partial:
+        return None
+
+    callback_context.state[key] = None
+    ttft = span["first_token"] - span["start"]
+    total = now - span["start"]
+    usage = llm_response.usage_metadata
+    output_tokens = usage.candidates_token_count if usage else None
+    generation_time = (now - span["first_token"]) or total
+    tokens_per_sec = output_tokens / generation_time if output_tokens and generation_time else 0.0
+    logger.info(
+        "%s: ttft=%.2fs total=%.2fs output_tokens=%s tokens_per_sec=%.1f",
+        callback_context.agent_name,
+        ttft,
+        total,
+        output_tokens,
+        tokens_per_sec,
+    )
+    return None
@@ -0,0 +1,120 @@
+import asyncio
+
+from google.genai import types
+from google.adk.tools import ToolContext
+from google.adk.tools.agent_tool import AgentTool
+from .sub_agents.data_analyst import data_analyst
+from .sub_agents.financial_analyst import financial_analyst
+from .sub_agents.news_analyst import news_analyst
+from .prompt import REPORT_PROMPT
+from .semantic_cache import lookup, store
+
+
+data_analyst_tool = AgentTool(agent=data_analyst)
+financial_analyst_tool = AgentTool(agent=financial_analyst)
+news_analyst_tool = AgentTool(agent=news_analyst)
+
+_REPORT_TEMPLATE = (
+    "# Executive Summary and Advice:\n{summary}\n\n"
+    "## Data Analyst Report:\n{data}\n\n"
+    "## Financial Analyst Report:\n{financial}\n\n"
+    "## News Analyst Report:\n{news}\n"
+)
+
+
+async def _run_analyst(tool: AgentTool, request: str, tool_context: ToolContext):
+    output_key = tool.agent.output_key
+    result, embedding = await lookup(tool_context, output_key, request)
+    if result is None:
+        result = await tool.run_async(args={"request": request}, tool_context=tool_context)
+        if embedding is not None and result:
+            store(tool_context, output_key, request, embedding, result)
+    return result
+
+
+async def gather_all_analyses(tool_context: ToolContext, ticker: str):
+    """
+    Runs the DataAnalyst, FinancialAnalyst and NewsAnalyst on a ticker concurrently.
+
+    The three analysts are independent, so running them together takes about as
+    long as the slowest one. Each result is also stored in state under
+    data_analyst_result, financial_analyst_result and news_analyst_result.
+
+    Args:
+        ticker (str): Stock ticker symbol (e.g., 'AAPL' for Apple Inc.)
+
+    Returns:
+        dict: A dictionary containing:
+            - ticker (str): The input ticker symbol
+            - success (bool): True if the operation was successful
+            - data_analyst_result (str): Company info, pricing, and financial metrics
+            - financial_analyst_result (str): Financial statement analysis
+            - news_analyst_result (str): Recent news summary
+    """
+    data_result, financial_result, news_result = await asyncio.gather(
+        _run_analyst(
+            data_analyst_tool,
+            f"Gather company info, stock price, and key financial metrics for {ticker}.",
+            tool_context,
+        ),
+        _run_analyst(
+            financial_analyst_tool,
+            f"Analyze the income statement, balance sheet, and cash flow of {ticker}.",
+            tool_context,
+        ),
+        _run_analyst(
+            news_analyst_tool,
+            f"Summarize the recent news about {ticker}.",
+            tool_context,
+        ),
+    )
+    return {
+        "ticker": ticker,
+        "success": True,
+        "data_analyst_result": data_result,
+        "financial_analyst_result": financial_result,
+        "news_analyst_result": news_result,
+    }
+
+
+def get_report_guidelines():
+    """
+    Returns the analysis methodology and required sections for an investment report.
+
+    Call this before writing the summary for save_advice_report.
+
+    Returns:
+        dict: A dictionary containing:
+            - success (bool): True if the operation was successful
+            - guidelines (str): The report methodology and requirements
+    """
+    return {
+        "success": True,
+        "guidelines": REPORT_PROMPT,
+    }
+
+
+async def save_advice_report(tool_context: ToolContext, summary: str, ticker: str):
+    state = tool_context.state
+    report = _REPORT_TEMPLATE.format(
+        summary=summary,
+        data=state.get("data_analyst_result"),
+        financial=state.get("financial_analyst_result"),
+        news=state.get("news_analyst_result"),
+    )
+    state["report"] = report
+
+    filename = f"{ticker}_investment_advice.md"
+
+    artifact = types.Part(
+        inline_data=types.Blob(
+            mime_type="text/markdown",
+            data=report.encode("utf-8"),
+        )
+    )
+
+    await tool_context.save_artifact(filename, artifact)
+
+    return {
+        "success": True,
+    }
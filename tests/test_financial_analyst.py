@@ -0,0 +1,93 @@
+import json
+
+import pandas as pd
+
+from financial_advisor.sub_agents.financial_analyst import _summarize_statements
+
+ANNUAL = pd.to_datetime(["2024-09-30", "2023-09-30", "2022-09-30"])
+QUARTERS = pd.to_datetime(
+    ["2024-12-31", "2024-09-30", "2024-06-30", "2024-03-31", "2023-12-31"]
+)
+
+
+def _statement(periods, rows: dict[str, list]) -> pd.DataFrame:
+    return pd.DataFrame(rows, index=periods).T
+
+
+def _summary(quarterly_net_income=(10, 0, -5, -10, 4)):
+    income = _statement(
+        ANNUAL,
+        {
+            "Total Revenue": [100, 90, 80],
+            "Gross Profit": [40, 35, 30],
+            "Operating Income": [30, 25, 20],
+            "Net Income": [20, None, 15],
+        },
+    )
+    balance = _statement(
+        ANNUAL,
+        {
+            "Current Assets": [50, 45, 40],
+            "Current Liabilities": [40, 40, 40],
+            "Total Debt": [60, 55, 50],
+            "Stockholders Equity": [30, 0, 25],
+        },
+    )
+    cash_flow = _statement(
+        ANNUAL,
+        {
+            "Operating Cash Flow": [30, 25, 20],
+            "Capital Expenditure": [-10, -8, -5],
+        },
+    )
+    quarterly_income = _statement(
+        QUARTERS,
+        {
+            "Total Revenue": [30, 25, 20, 25, 20],
+            "Net Income": list(quarterly_net_income),
+        },
+    )
+    return _summarize_statements("TEST", income, balance, cash_flow, quarterly_income)
+
+
+def test_summarize_statements_ratios():
+    summary = _summary()
+
+    assert summary["period"] == "2024-09-30"
+    assert summary["margins"] == {
+        "gross_margin": 0.4,
+        "operating_margin": 0.3,
+        "net_margin": 0.2,
+    }
+    assert summary["liquidity"] == {"current_ratio": 1.25, "debt_to_equity": 2.0}
+    assert summary["cash_flow"] == {
+        "operating_cash_flow": 30.0,
+        "free_cash_flow": 20.0,
+    }
+
+
+def test_summarize_statements_growth():
+    trends = _summary()["trends"]
+
+    assert trends["revenue_growth_yoy"] == 0.1111
+    # The prior year's net income is missing, so there is no year-over-year change.
+    assert trends["net_income_growth_yoy"] is None
+    assert trends["free_cash_flow_growth_yoy"] == 0.1765
+    assert trends["revenue_qoq"] == {
+        "2024-12-31": 0.2,
+        "2024-09-30": 0.25,
+        "2024-06-30": -0.2,
+        "2024-03-31": 0.25,
+    }
+
+
+def test_quarterly_changes_handle_zero_and_negative_quarters():
+    summary = _summary(quarterly_net_income=(10, 0, -5, -10, 4))
+
+    # 0 -> 10 has no meaningful percentage change; -10 -> -5 is an improvement.
+    assert summary["trends"]["net_income_qoq"] == {
+        "2024-09-30": 1.0,
+        "2024-06-30": 0.5,
+        "2024-03-31": -3.5,
+    }
+    json.dumps(summary, allow_nan=False)